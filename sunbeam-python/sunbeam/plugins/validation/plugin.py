@@ -13,15 +13,18 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
+import asyncio
+import functools
 import logging
+import re
 import subprocess
+import time
 from datetime import datetime
 from pathlib import Path
-from typing import Any, Dict, List, Optional
+from typing import Any, Dict, List, Optional, Set, Tuple
 
 import click
 import pydantic
-from croniter import croniter
 from packaging.version import Version
 from rich import box
 from rich.console import Console
@@ -56,10 +59,30 @@ from sunbeam.plugins.interface.v1.openstack import (
 from sunbeam.versions import TEMPEST_CHANNEL
 
 LOG = logging.getLogger(__name__)
-console = Console()
 
 PLUGIN_VERSION = "0.0.1"
 MINIMAL_PERIOD = 15 * 60  # 15 minutes in seconds
+# constant base time for consistency when evaluating cron schedules
+_CRON_BASE = datetime(2004, 3, 5)
+_MINIMAL_PERIOD_ERROR = (
+    "Cannot schedule periodic check to run faster than every 15 minutes."
+)
+# croniter error messages rewritten to suit vixie cron:
+# croniter supports second (and year) repeats, but vixie cron does not.
+_CRONITER_ERROR_REWRITES = (
+    (
+        "Exactly 5 or 6 columns",
+        "Exactly 5 columns must be specified for iterator expression.",
+    ),
+    (
+        "Exactly 5, 6 or 7 columns",
+        "Exactly 5 columns must be specified for iterator expression.",
+    ),
+)
+# matches a single cron field
+_FIELD_RE = re.compile(r"\S+")
+# matches a whole schedule of the form "*/N * * * *"
+_MINUTE_STEP_RE = re.compile(r"\s*\*/(\d+)(?:\s+\*){4}\s*")
 TEMPEST_APP_NAME = "tempest"
 TEMPEST_CONTAINER_NAME = "tempest"
 TEMPEST_VALIDATION_RESULT = "/var/lib/tempest/workspace/tempest-validation.log"
@@ -67,6 +90,24 @@ VALIDATION_PLUGIN_DEPLOY_TIMEOUT = (
     60 * 60
 )  # 60 minutes in seconds, tempest can take some time to initialized
 SUPPORTED_TEMPEST_CONFIG = {"schedule"}
+# Plan values handed out by ValidationPlugin; callers get copies
+# since they may mutate them.
+_APP_NAMES = (TEMPEST_APP_NAME,)
+_TFVARS_ENABLE = {"enable-validation": True}
+_TFVARS_DISABLE = {"enable-validation": False}
+_TFVARS_RESIZE: dict = {}
+ENABLED_PLUGINS_CACHE_TTL = 5  # seconds
+
+_enabled_plugins_cache: Optional[Tuple[float, Set[str]]] = None
+
+
+@functools.lru_cache(maxsize=1)
+def _get_console() -> Console:
+    """Return the console shared by the validation plugin.
+
+    Built on first use to keep terminal detection out of import time.
+    """
+    return Console()
 
 
 class Profile(pydantic.BaseModel):
@@ -105,6 +146,76 @@ PROFILES = {
 }
 
 
+@functools.lru_cache(maxsize=128)
+def _validate_schedule_impl(schedule: str) -> Tuple[bool, str]:
+    """Validate a non-empty cron schedule.
+
+    Return (True, "") if valid, otherwise (False, error message).
+    Results are cached, so this must not raise for invalid schedules.
+    """
+    # croniter supports second repeats, but vixie cron does not.
+    if sum(1 for _ in _FIELD_RE.finditer(schedule)) == 6:
+        return (
+            False,
+            "This cron does not support seconds in schedule (6 fields)."
+            " Exactly 5 columns must be specified for iterator expression.",
+        )
+
+    match = _MINUTE_STEP_RE.fullmatch(schedule)
+    step = int(match.group(1)) if match else 0
+    if 0 < step < 60:
+        # Fast path for "*/N * * * *": the gap between the first two runs
+        # after the base time (at minute 0) is N, or 60 - N when only one
+        # run fits in the hour. This mirrors the croniter check below.
+        gap = step if 2 * step < 60 else 60 - step
+        if gap * 60 < MINIMAL_PERIOD:
+            return False, _MINIMAL_PERIOD_ERROR
+        return True, ""
+
+    # Imported here to keep croniter off the import path of the CLI;
+    # it is only needed when validating a non-trivial schedule.
+    from croniter import croniter
+
+    try:
+        cron = croniter(schedule, _CRON_BASE, max_years_between_matches=1)
+    except ValueError as e:
+        msg = str(e)
+        for needle, replacement in _CRONITER_ERROR_REWRITES:
+            if needle in msg:
+                msg = replacement
+                break
+        return False, msg
+
+    # This is a rather naive method for enforcing this,
+    # and it may be possible to craft an expression
+    # that results in some consecutive runs within 15 minutes,
+    # however this is fine, as there is process locking for tempest,
+    # and this is more of a sanity check than a security requirement.
+    t1 = cron.get_next(float)
+    t2 = cron.get_next(float)
+    if t2 - t1 < MINIMAL_PERIOD:
+        return False, _MINIMAL_PERIOD_ERROR
+
+    return True, ""
+
+
+def validated_schedule(schedule: str) -> str:
+    """Validate a cron schedule.
+
+    Return the valid schedule if valid,
+    otherwise Raise a click ClickException.
+    """
+    # Empty schedule is fine; it means it's disabled in this context.
+    if not schedule:
+        return ""
+
+    valid, msg = _validate_schedule_impl(schedule)
+    if not valid:
+        raise click.ClickException(msg)
+
+    return schedule
+
+
 class Config(pydantic.BaseModel):
     """Represents config updates provided by the user.
 
@@ -115,48 +226,8 @@ class Config(pydantic.BaseModel):
 
     @pydantic.validator("schedule")
     def validate_schedule(cls, schedule: str) -> str:  # noqa N805
-        """Validate the schedule config option.
-
-        Return the valid schedule if valid,
-        otherwise Raise a click BadParameter exception.
-        """
-        # Empty schedule is fine; it means it's disabled in this context.
-        if not schedule:
-            return ""
-
-        # croniter supports second repeats, but vixie cron does not.
-        if len(schedule.split()) == 6:
-            raise click.ClickException(
-                "This cron does not support seconds in schedule (6 fields)."
-                " Exactly 5 columns must be specified for iterator expression."
-            )
-
-        # constant base time for consistency
-        base = datetime(2004, 3, 5)
-
-        try:
-            cron = croniter(schedule, base, max_years_between_matches=1)
-        except ValueError as e:
-            msg = str(e)
-            # croniter supports second repeats, but vixie cron does not,
-            # so update the error message here to suit.
-            if "Exactly 5 or 6 columns" in msg:
-                msg = "Exactly 5 columns must be specified for iterator expression."
-            raise click.ClickException(msg)
-
-        # This is a rather naive method for enforcing this,
-        # and it may be possible to craft an expression
-        # that results in some consecutive runs within 15 minutes,
-        # however this is fine, as there is process locking for tempest,
-        # and this is more of a sanity check than a security requirement.
-        t1 = cron.get_next()
-        t2 = cron.get_next()
-        if t2 - t1 < MINIMAL_PERIOD:
-            raise click.ClickException(
-                "Cannot schedule periodic check to run faster than every 15 minutes."
-            )
-
-        return schedule
+        """Validate the schedule config option."""
+        return validated_schedule(schedule)
 
 
 def parse_config_args(args: List[str]) -> Dict[str, str]:
@@ -166,10 +237,9 @@ def parse_config_args(args: List[str]) -> Dict[str, str]:
     """
     config = {}
     for arg in args:
-        split_arg = arg.split("=", 1)
-        if len(split_arg) == 1:
+        key, sep, value = arg.partition("=")
+        if not sep or not key:
             raise click.ClickException("syntax: key=value")
-        key, value = split_arg
         if key in config:
             raise click.ClickException(
                 f"{key!r} parameter seen multiple times. Only provide it once."
@@ -191,6 +261,30 @@ def validated_config_args(args: Dict[str, str]) -> Config:
     return Config(**args)
 
 
+def _cached_enabled_plugins(deployment: Deployment) -> Set[str]:
+    """Return the names of enabled plugins, cached for a short time.
+
+    Querying enabled plugins goes through the cluster for every plugin,
+    so reuse the result for repeated lookups within the same process.
+    """
+    global _enabled_plugins_cache
+    now = time.monotonic()
+    if (
+        _enabled_plugins_cache is not None
+        and now - _enabled_plugins_cache[0] < ENABLED_PLUGINS_CACHE_TTL
+    ):
+        return _enabled_plugins_cache[1]
+    enabled_plugins = set(PluginManager.enabled_plugins(deployment))
+    _enabled_plugins_cache = (now, enabled_plugins)
+    return enabled_plugins
+
+
+def _check_action_result(action_result: Dict[str, Any], action_name: str) -> None:
+    """Raise a click exception if the action result reports a failure."""
+    if action_result.get("return-code", 0) > 1:
+        raise click.ClickException(f"Unable to run action: {action_name}")
+
+
 class ConfigureValidationStep(BaseStep):
     """Configure validation plugin."""
 
@@ -237,10 +331,27 @@ class ConfigureValidationStep(BaseStep):
         return Result(ResultType.COMPLETED)
 
 
+class _LazyVersion:
+    """Class attribute parsing a version string on first access.
+
+    Keeps packaging.version parsing out of module import time.
+    """
+
+    def __init__(self, version: str):
+        self._raw_version = version
+        self._version: Optional[Version] = None
+
+    def __get__(self, obj: Any, objtype: Optional[type] = None) -> Version:
+        """Return the parsed version, parsing it on first access."""
+        if self._version is None:
+            self._version = Version(self._raw_version)
+        return self._version
+
+
 class ValidationPlugin(OpenStackControlPlanePlugin):
     """Deploy tempest to openstack model."""
 
-    version = Version(PLUGIN_VERSION)
+    version = _LazyVersion(PLUGIN_VERSION)
 
     def __init__(self, deployment: Deployment) -> None:
         """Initialize the plugin class."""
@@ -249,6 +360,8 @@ class ValidationPlugin(OpenStackControlPlanePlugin):
             deployment,
             tf_plan_location=TerraformPlanLocation.SUNBEAM_TERRAFORM_REPO,
         )
+        # Cached result of self.enabled, see commands()
+        self._enabled_cache: Optional[bool] = None
 
     def manifest_defaults(self) -> SoftwareConfig:
         """Plugin software configuration."""
@@ -272,15 +385,15 @@ class ValidationPlugin(OpenStackControlPlanePlugin):
 
     def set_application_names(self) -> list:
         """Application names handled by the terraform plan."""
-        return [TEMPEST_APP_NAME]
+        return list(_APP_NAMES)
 
     def set_tfvars_on_enable(self) -> dict:
         """Set terraform variables to enable the application."""
-        return {"enable-validation": True}
+        return _TFVARS_ENABLE.copy()
 
     def set_tfvars_on_disable(self) -> dict:
         """Set terraform variables to disable the application."""
-        return {"enable-validation": False}
+        return _TFVARS_DISABLE.copy()
 
     def set_application_timeout_on_enable(self) -> int:
         """Set Application Timeout on enabling the plugin.
@@ -300,33 +413,35 @@ class ValidationPlugin(OpenStackControlPlanePlugin):
 
     def set_tfvars_on_resize(self) -> dict:
         """Set terraform variables to resize the application."""
-        return {}
-
-    def _get_tempest_leader_unit(self) -> str:
-        """Return the leader unit of tempest application."""
-        jhelper = JujuHelper(self.deployment.get_connected_controller())
-        with console.status(f"Retrieving {TEMPEST_APP_NAME}'s unit name."):
-            app = TEMPEST_APP_NAME
-            model = OPENSTACK_MODEL
-            try:
-                unit = run_sync(jhelper.get_leader_unit(app, model))
-            except (ApplicationNotFoundException, LeaderNotFoundException) as e:
-                raise click.ClickException(str(e))
-            return unit
+        return _TFVARS_RESIZE.copy()
+
+    @functools.cached_property
+    def _jhelper(self) -> JujuHelper:
+        """Juju helper connected to the deployment controller.
 
-    def _get_tempest_absolute_model_name(self) -> str:
-        """Return the absolute model name where the tempest unit resides."""
-        jhelper = JujuHelper(self.deployment.get_connected_controller())
-        with console.status(
-            f"Retrieving the absolute model name for {TEMPEST_APP_NAME}'s unit."
+        Built on first use and reused, so the controller connection
+        is only set up once per plugin instance.
+        """
+        return JujuHelper(self.deployment.get_connected_controller())
+
+    def _get_tempest_unit_and_model_name(self) -> Tuple[str, str]:
+        """Return the tempest leader unit and its absolute model name."""
+        jhelper = self._jhelper
+
+        async def _lookup() -> List[str]:
+            return await asyncio.gather(
+                jhelper.get_leader_unit(TEMPEST_APP_NAME, OPENSTACK_MODEL),
+                jhelper.get_model_name_with_owner(OPENSTACK_MODEL),
+            )
+
+        with _get_console().status(
+            f"Retrieving {TEMPEST_APP_NAME}'s unit name and absolute model name."
         ):
             try:
-                model_name = run_sync(
-                    jhelper.get_model_name_with_owner(OPENSTACK_MODEL)
-                )
+                unit, model_name = run_sync(_lookup())
             except (ApplicationNotFoundException, LeaderNotFoundException) as e:
                 raise click.ClickException(str(e))
-            return f"{self.deployment.controller}:{model_name}"
+            return unit, f"{self.deployment.controller}:{model_name}"
 
     def _run_action_on_tempest_unit(
         self,
@@ -334,32 +449,35 @@ class ValidationPlugin(OpenStackControlPlanePlugin):
         action_params: Optional[dict] = None,
         progress_message: str = "",
     ) -> Dict[str, Any]:
-        """Run the charm's action."""
-        unit = self._get_tempest_leader_unit()
-        jhelper = JujuHelper(self.deployment.get_connected_controller())
-        with console.status(progress_message):
+        """Run the charm's action on the tempest leader unit."""
+        jhelper = self._jhelper
+
+        async def _run_action() -> Dict[str, Any]:
+            unit = await jhelper.get_leader_unit(TEMPEST_APP_NAME, OPENSTACK_MODEL)
+            return await jhelper.run_action(
+                unit,
+                OPENSTACK_MODEL,
+                action_name,
+                action_params or {},
+            )
+
+        with _get_console().status(progress_message):
             try:
-                action_result = run_sync(
-                    jhelper.run_action(
-                        unit,
-                        OPENSTACK_MODEL,
-                        action_name,
-                        action_params or {},
-                    )
-                )
-            except (ActionFailedException, UnitNotFoundException) as e:
+                action_result = run_sync(_run_action())
+            except (
+                ApplicationNotFoundException,
+                LeaderNotFoundException,
+                ActionFailedException,
+                UnitNotFoundException,
+            ) as e:
                 raise click.ClickException(str(e))
 
-            if action_result.get("return-code", 0) > 1:
-                message = f"Unable to run action: {action_name}"
-                raise click.ClickException(message)
-
+            _check_action_result(action_result, action_name)
             return action_result
 
     def _check_file_exist_in_tempest_container(self, filename: str) -> bool:
         """Check if file exist in tempest container."""
-        unit = self._get_tempest_leader_unit()
-        model_name = self._get_tempest_absolute_model_name()
+        unit, model_name = self._get_tempest_unit_and_model_name()
         # Note: this is a workaround to run command to payload container
         # since python-libjuju does not support such feature. See related
         # bug: https://github.com/juju/python-libjuju/issues/1029
@@ -388,14 +506,13 @@ class ValidationPlugin(OpenStackControlPlanePlugin):
 
     def _copy_file_from_tempest_container(self, source: str, destination: str) -> None:
         """Copy file from tempest container."""
-        unit = self._get_tempest_leader_unit()
-        model_name = self._get_tempest_absolute_model_name()
+        unit, model_name = self._get_tempest_unit_and_model_name()
         progress_message = (
             f"Copying {source} from "
             f"{TEMPEST_APP_NAME} ({TEMPEST_CONTAINER_NAME}) "
             f"to {destination} ..."
         )
-        with console.status(progress_message):
+        with _get_console().status(progress_message):
             # Note: this is a workaround to run command to payload container
             # since python-libjuju does not support such feature. See related
             # bug: https://github.com/juju/python-libjuju/issues/1029
@@ -422,19 +539,18 @@ class ValidationPlugin(OpenStackControlPlanePlugin):
 
     def _configure_preflight_check(self) -> bool:
         """Preflight check for configure command."""
-        enabled_plugins = PluginManager.enabled_plugins(self.deployment)
-        if "observability" not in enabled_plugins:
-            return False
-        return True
+        return "observability" in _cached_enabled_plugins(self.deployment)
 
     @click.command()
     def enable_plugin(self) -> None:
         """Enable OpenStack Integration Test Suite (tempest)."""
+        self._enabled_cache = None
         super().enable_plugin()
 
     @click.command()
     def disable_plugin(self) -> None:
         """Disable OpenStack Integration Test Suite (tempest)."""
+        self._enabled_cache = None
         super().disable_plugin()
 
     @click.command()
@@ -453,7 +569,7 @@ class ValidationPlugin(OpenStackControlPlanePlugin):
             )
 
         if not options:
-            console.print(
+            _get_console().print(
                 "Config options available: \n\n"
                 "schedule: set a cron schedule for running periodic tests.  "
                 "Empty disables.\n\n"
@@ -476,7 +592,7 @@ class ValidationPlugin(OpenStackControlPlanePlugin):
                     self.get_tfvar_config_key(),
                 ),
             ],
-            console,
+            _get_console(),
         )
 
     @click.command()
@@ -516,12 +632,12 @@ class ValidationPlugin(OpenStackControlPlanePlugin):
             progress_message=progress_message,
         )
 
-        console.print(action_result.get("summary").strip())
+        _get_console().print(action_result.get("summary").strip())
 
         if output:
             # Due to shelling out to the juju cli (rather than using libjuju),
             # we need to ensure the juju cli is logged in.
-            run_plan([JujuLoginStep(self.deployment.juju_account)], console)
+            run_plan([JujuLoginStep(self.deployment.juju_account)], _get_console())
 
             self._copy_file_from_tempest_container(TEMPEST_VALIDATION_RESULT, output)
 
@@ -536,7 +652,7 @@ class ValidationPlugin(OpenStackControlPlanePlugin):
         )
         for profile in PROFILES.values():
             table.add_row(profile.name, profile.help)
-        console.print(table)
+        _get_console().print(table)
 
     @click.command()
     @click.option(
@@ -550,7 +666,7 @@ class ValidationPlugin(OpenStackControlPlanePlugin):
         """Get last validation result."""
         # Due to shelling out to the juju cli (rather than using libjuju),
         # we need to ensure the juju cli is logged in.
-        run_plan([JujuLoginStep(self.deployment.juju_account)], console)
+        run_plan([JujuLoginStep(self.deployment.juju_account)], _get_console())
 
         if not self._check_file_exist_in_tempest_container(TEMPEST_VALIDATION_RESULT):
             raise click.ClickException(
@@ -568,35 +684,31 @@ class ValidationPlugin(OpenStackControlPlanePlugin):
     def commands(self) -> dict:
         """Dict of clickgroup along with commands."""
         commands = super().commands()
-        try:
-            enabled = self.enabled
-        except ClusterServiceUnavailableException:
-            LOG.debug(
-                "Failed to query for plugin status, is cloud bootstrapped ?",
-                exc_info=True,
-            )
-            enabled = False
-
-        if enabled:
-            commands.update(
-                {
-                    # sunbeam configure validation ...
-                    "configure": [
-                        {"name": "validation", "command": self.configure_validation}
-                    ],
-                    # add the validation subcommand group to the root group:
-                    # sunbeam validation ...
-                    "init": [{"name": "validation", "command": self.validation_group}],
-                    # add the subcommands:
-                    # sunbeam validation run ... etc.
-                    "init.validation": [
-                        {"name": "run", "command": self.run_validate_action},
-                        {"name": "profiles", "command": self.list_profiles},
-                        {
-                            "name": "get-last-result",
-                            "command": self.run_get_last_result,
-                        },
-                    ],
-                }
-            )
+        if self._enabled_cache is None:
+            try:
+                self._enabled_cache = self.enabled
+            except ClusterServiceUnavailableException:
+                LOG.debug(
+                    "Failed to query for plugin status, is cloud bootstrapped ?",
+                    exc_info=True,
+                )
+                self._enabled_cache = False
+
+        if not self._enabled_cache:
+            return commands
+
+        # sunbeam configure validation ...
+        commands["configure"] = [
+            {"name": "validation", "command": self.configure_validation}
+        ]
+        # add the validation subcommand group to the root group:
+        # sunbeam validation ...
+        commands["init"] = [{"name": "validation", "command": self.validation_group}]
+        # add the subcommands:
+        # sunbeam validation run ... etc.
+        commands["init.validation"] = [
+            {"name": "run", "command": self.run_validate_action},
+            {"name": "profiles", "command": self.list_profiles},
+            {"name": "get-last-result", "command": self.run_get_last_result},
+        ]
         return commands
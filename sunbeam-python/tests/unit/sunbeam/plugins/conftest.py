@@ -0,0 +1,38 @@
+# Copyright (c) 2024 Canonical Ltd.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import asyncio
+
+import pytest
+
+
+@pytest.fixture(scope="session")
+def run_sync_loop():
+    """Event loop shared by all plugin tests."""
+    loop = asyncio.new_event_loop()
+    yield loop
+    loop.close()
+
+
+@pytest.fixture()
+def patch_run_sync(mocker, run_sync_loop):
+    """Return a helper patching run_sync at a target to use the shared loop."""
+
+    def run_sync(coro):
+        return run_sync_loop.run_until_complete(coro)
+
+    def _patch(target: str) -> None:
+        mocker.patch(target, run_sync)
+
+    return _patch
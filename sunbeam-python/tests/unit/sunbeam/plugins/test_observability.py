@@ -12,7 +12,6 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
-import asyncio
 from unittest.mock import AsyncMock, Mock, patch
 
 import pytest
@@ -24,18 +23,8 @@ from sunbeam.plugins.observability import plugin as observability_plugin
 
 
 @pytest.fixture(autouse=True)
-def mock_run_sync(mocker):
-    try:
-        loop = asyncio.get_running_loop()
-    except RuntimeError:
-        loop = asyncio.new_event_loop()
-
-    def run_sync(coro):
-        return loop.run_until_complete(coro)
-
-    mocker.patch("sunbeam.plugins.observability.plugin.run_sync", run_sync)
-    yield
-    loop.close()
+def mock_run_sync(patch_run_sync):
+    patch_run_sync("sunbeam.plugins.observability.plugin.run_sync")
 
 
 @pytest.fixture()
@@ -12,7 +12,6 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
-import asyncio
 import json
 from pathlib import Path
 from unittest.mock import AsyncMock, Mock, patch
@@ -26,18 +25,8 @@ from sunbeam.jobs.juju import TimeoutException
 
 
 @pytest.fixture(autouse=True)
-def mock_run_sync(mocker):
-    try:
-        loop = asyncio.get_running_loop()
-    except RuntimeError:
-        loop = asyncio.new_event_loop()
-
-    def run_sync(coro):
-        return loop.run_until_complete(coro)
-
-    mocker.patch("sunbeam.plugins.interface.v1.openstack.run_sync", run_sync)
-    yield
-    loop.close()
+def mock_run_sync(patch_run_sync):
+    patch_run_sync("sunbeam.plugins.interface.v1.openstack.run_sync")
 
 
 @pytest.fixture()
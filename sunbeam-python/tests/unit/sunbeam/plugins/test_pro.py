@@ -12,7 +12,6 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
-import asyncio
 import unittest
 from unittest.mock import AsyncMock, Mock
 
@@ -28,18 +27,8 @@ from sunbeam.plugins.pro.plugin import (
 
 
 @pytest.fixture(autouse=True)
-def mock_run_sync(mocker):
-    try:
-        loop = asyncio.get_running_loop()
-    except RuntimeError:
-        loop = asyncio.new_event_loop()
-
-    def run_sync(coro):
-        return loop.run_until_complete(coro)
-
-    mocker.patch("sunbeam.plugins.pro.plugin.run_sync", run_sync)
-    yield
-    loop.close()
+def mock_run_sync(patch_run_sync):
+    patch_run_sync("sunbeam.plugins.pro.plugin.run_sync")
 
 
 class TestEnableUbuntuProApplicationStep(unittest.TestCase):
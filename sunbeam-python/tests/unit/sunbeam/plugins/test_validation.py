@@ -12,49 +12,80 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
+from unittest.mock import AsyncMock
+
 import click
 import pytest
+from packaging.version import Version
 
 from sunbeam.plugins.validation import plugin as validation_plugin
 
+VALID_CRONS = [
+    "",
+    "5 4 * * *",
+    "5 4 * * mon",
+    "*/30 * * * *",
+    "*/45 * * * *",
+    "*/60 * * * *",
+]
+VALID_CRON_IDS = [f"c{i}" for i in range(len(VALID_CRONS))]
+INVALID_CRONS = [
+    ("*/5 * * * *", "Cannot schedule periodic check"),
+    ("*/50 * * * *", "Cannot schedule periodic check"),
+    ("*/30 * * * * 6", "This cron does not support"),
+    ("*/30 * *", "Exactly 5 columns must"),
+    ("*/5 * * * xyz", "not acceptable"),
+]
+INVALID_CRON_IDS = [f"c{i}" for i in range(len(INVALID_CRONS))]
+
+
+@pytest.fixture()
+def mock_run_sync(patch_run_sync):
+    patch_run_sync("sunbeam.plugins.validation.plugin.run_sync")
+
+
+@pytest.fixture()
+def jhelper(mocker):
+    jhelper = AsyncMock()
+    mocker.patch.object(validation_plugin, "JujuHelper", return_value=jhelper)
+    yield jhelper
+
 
 class TestValidatorFunction:
     """Test validator functions."""
 
-    @pytest.mark.parametrize(
-        "input_schedule",
-        [
-            "",
-            "5 4 * * *",
-            "5 4 * * mon",
-            "*/30 * * * *",
-        ],
-    )
+    @pytest.mark.parametrize("input_schedule", VALID_CRONS, ids=VALID_CRON_IDS)
     def test_valid_cron_expressions(self, input_schedule):
         """Verify valid cron expressions."""
         config = validation_plugin.Config(schedule=input_schedule)
         assert config.schedule == input_schedule
 
     @pytest.mark.parametrize(
-        "test_input,expected_msg",
-        [
-            ("*/5 * * * *", "Cannot schedule periodic check"),
-            ("*/30 * * * * 6", "This cron does not support"),
-            ("*/30 * *", "Exactly 5 columns must"),
-            ("*/5 * * * xyz", "not acceptable"),
-        ],
+        "test_input,expected_msg", INVALID_CRONS, ids=INVALID_CRON_IDS
     )
     def test_invalid_cron_expressions(self, test_input, expected_msg):
         """Verify invalid cron expressions."""
         with pytest.raises(click.ClickException) as e:
             validation_plugin.Config(schedule=test_input)
-            assert expected_msg in str(e)
+        assert expected_msg in str(e.value)
+
+    @pytest.mark.parametrize("input_schedule", VALID_CRONS, ids=VALID_CRON_IDS)
+    def test_validated_schedule(self, input_schedule):
+        """Verify validated_schedule returns valid schedules unchanged."""
+        assert validation_plugin.validated_schedule(input_schedule) == input_schedule
+
+    def test_invalid_cron_expression_raises_on_every_call(self):
+        """Verify cached validation results still raise each time."""
+        for _ in range(2):
+            with pytest.raises(click.ClickException):
+                validation_plugin.Config(schedule="*/5 * * * *")
 
     @pytest.mark.parametrize(
         "test_args",
         [
             ["option_a 1"],
             ["option_b=1", "option_c 2"],
+            ["=1"],
         ],
     )
     def test_parse_config_args_syntax_error(self, test_args):
@@ -79,6 +110,7 @@ class TestValidatorFunction:
             (["option_a=1"], {"option_a": "1"}),
             (["option_b = 2"], {"option_b ": " 2"}),
             (["option_a=1", "option_b = 2"], {"option_a": "1", "option_b ": " 2"}),
+            (["option_c=a=b"], {"option_c": "a=b"}),
         ],
     )
     def test_valid_parse_config_args(self, test_args, expected_output):
@@ -88,34 +120,22 @@ class TestValidatorFunction:
         for k, v in output.items():
             assert expected_output[k] == v
 
-    @pytest.mark.parametrize(
-        "input_args",
-        [
-            {"schedule": ""},
-            {"schedule": "5 4 * * *"},
-            {"schedule": "5 4 * * mon"},
-            {"schedule": "*/30 * * * *"},
-        ],
-    )
-    def test_valid_schedule_validated_config_args(self, input_args):
+    @pytest.mark.parametrize("input_schedule", VALID_CRONS, ids=VALID_CRON_IDS)
+    def test_valid_schedule_validated_config_args(self, input_schedule):
         """Test validated_config_args handles valid key correctly."""
-        config = validation_plugin.validated_config_args(input_args)
-        assert config.schedule == input_args["schedule"]
+        config = validation_plugin.validated_config_args({"schedule": input_schedule})
+        assert config.schedule == input_schedule
 
     @pytest.mark.parametrize(
-        "input_args",
-        [
-            {"schedule": "*/5 * * * *"},
-            {"schedule": "*/30 * * * * 6"},
-            {"schedule": "*/30 * *"},
-            {"schedule": "*/5 * * * xyz"},
-        ],
+        "input_schedule,_expected_msg", INVALID_CRONS, ids=INVALID_CRON_IDS
     )
-    def test_invalid_schedule_validated_config_args(self, input_args):
+    def test_invalid_schedule_validated_config_args(
+        self, input_schedule, _expected_msg
+    ):
         """Test validated_config_args handles valid key but invalid value correctly."""
         # This is raise by `validated_schedule`
         with pytest.raises(click.ClickException):
-            validation_plugin.validated_config_args(input_args)
+            validation_plugin.validated_config_args({"schedule": input_schedule})
 
     @pytest.mark.parametrize(
         "input_args",
@@ -129,3 +149,138 @@ class TestValidatorFunction:
         # This is raise by `validated_config_args`
         with pytest.raises(click.ClickException):
             validation_plugin.validated_config_args(input_args)
+
+    @pytest.mark.parametrize("return_code", [0, 1])
+    def test_check_action_result(self, return_code):
+        validation_plugin._check_action_result({"return-code": return_code}, "validate")
+
+    def test_check_action_result_failed(self):
+        with pytest.raises(click.ClickException, match="validate"):
+            validation_plugin._check_action_result({"return-code": 2}, "validate")
+
+
+class TestCachedEnabledPlugins:
+    """Test the enabled plugins cache."""
+
+    def test_enabled_plugins_queried_once(self, mocker):
+        mocker.patch.object(validation_plugin, "_enabled_plugins_cache", None)
+        enabled_plugins = mocker.patch.object(
+            validation_plugin.PluginManager,
+            "enabled_plugins",
+            return_value=["observability"],
+        )
+        deployment = mocker.Mock()
+        for _ in range(2):
+            assert "observability" in validation_plugin._cached_enabled_plugins(
+                deployment
+            )
+        enabled_plugins.assert_called_once_with(deployment)
+
+    def test_enabled_plugins_cache_expires(self, mocker):
+        mocker.patch.object(validation_plugin, "_enabled_plugins_cache", None)
+        enabled_plugins = mocker.patch.object(
+            validation_plugin.PluginManager, "enabled_plugins", return_value=[]
+        )
+        monotonic = mocker.patch.object(validation_plugin.time, "monotonic")
+        monotonic.return_value = 100.0
+        validation_plugin._cached_enabled_plugins(mocker.Mock())
+        monotonic.return_value += validation_plugin.ENABLED_PLUGINS_CACHE_TTL
+        validation_plugin._cached_enabled_plugins(mocker.Mock())
+        assert enabled_plugins.call_count == 2
+
+
+class TestValidationPlugin:
+    """Test ValidationPlugin."""
+
+    def test_enabled_queried_once(self, snap_env, mocker):
+        enabled = mocker.patch.object(
+            validation_plugin.ValidationPlugin,
+            "enabled",
+            new_callable=mocker.PropertyMock,
+            return_value=True,
+        )
+        plugin = validation_plugin.ValidationPlugin(mocker.Mock())
+        for _ in range(2):
+            assert set(plugin.commands()) == {
+                "enable",
+                "disable",
+                "configure",
+                "init",
+                "init.validation",
+            }
+        enabled.assert_called_once()
+
+    def test_jhelper_built_once(self, snap_env, mocker):
+        jhelper = mocker.patch.object(validation_plugin, "JujuHelper")
+        deployment = mocker.Mock()
+        plugin = validation_plugin.ValidationPlugin(deployment)
+        assert plugin._jhelper is plugin._jhelper
+        jhelper.assert_called_once_with(
+            deployment.get_connected_controller.return_value
+        )
+        deployment.get_connected_controller.assert_called_once()
+
+    def test_cluster_unavailable(self, snap_env, mocker):
+        mocker.patch.object(
+            validation_plugin.ValidationPlugin,
+            "enabled",
+            new_callable=mocker.PropertyMock,
+            side_effect=validation_plugin.ClusterServiceUnavailableException(),
+        )
+        plugin = validation_plugin.ValidationPlugin(mocker.Mock())
+        assert set(plugin.commands()) == {"enable", "disable"}
+
+    def test_version(self, snap_env, mocker):
+        plugin = validation_plugin.ValidationPlugin(mocker.Mock())
+        assert validation_plugin.ValidationPlugin.version == Version(
+            validation_plugin.PLUGIN_VERSION
+        )
+        assert plugin.version is validation_plugin.ValidationPlugin.version
+
+    def test_run_action_on_tempest_unit(self, snap_env, mocker, mock_run_sync, jhelper):
+        jhelper.get_leader_unit.return_value = "tempest/0"
+        jhelper.run_action.return_value = {"return-code": 0, "summary": "ok"}
+        plugin = validation_plugin.ValidationPlugin(mocker.Mock())
+        result = plugin._run_action_on_tempest_unit("validate", {"regex": "smoke"})
+        assert result["summary"] == "ok"
+        jhelper.get_leader_unit.assert_awaited_once_with(
+            validation_plugin.TEMPEST_APP_NAME, validation_plugin.OPENSTACK_MODEL
+        )
+        jhelper.run_action.assert_awaited_once_with(
+            "tempest/0",
+            validation_plugin.OPENSTACK_MODEL,
+            "validate",
+            {"regex": "smoke"},
+        )
+
+    def test_run_action_on_tempest_unit_no_leader(
+        self, snap_env, mocker, mock_run_sync, jhelper
+    ):
+        jhelper.get_leader_unit.side_effect = validation_plugin.LeaderNotFoundException(
+            "no leader"
+        )
+        plugin = validation_plugin.ValidationPlugin(mocker.Mock())
+        with pytest.raises(click.ClickException):
+            plugin._run_action_on_tempest_unit("validate")
+        jhelper.run_action.assert_not_awaited()
+
+    def test_run_action_on_tempest_unit_failed(
+        self, snap_env, mocker, mock_run_sync, jhelper
+    ):
+        jhelper.get_leader_unit.return_value = "tempest/0"
+        jhelper.run_action.return_value = {"return-code": 2}
+        plugin = validation_plugin.ValidationPlugin(mocker.Mock())
+        with pytest.raises(click.ClickException):
+            plugin._run_action_on_tempest_unit("validate")
+
+    def test_get_tempest_unit_and_model_name(
+        self, snap_env, mocker, mock_run_sync, jhelper
+    ):
+        jhelper.get_leader_unit.return_value = "tempest/0"
+        jhelper.get_model_name_with_owner.return_value = "admin/openstack"
+        deployment = mocker.Mock(controller="sunbeam-controller")
+        plugin = validation_plugin.ValidationPlugin(deployment)
+        assert plugin._get_tempest_unit_and_model_name() == (
+            "tempest/0",
+            "sunbeam-controller:admin/openstack",
+        )